@@ -45,7 +45,7 @@ void Acceptor::handle_input( bool& )
 
 inline void Acceptor::listen()
 {
-  sock.listen( 100 );
+  sock.listen( SOMAXCONN );
 }
 
 
@@ -12,6 +12,18 @@
 
 using namespace iqnet;
 
+namespace {
+
+// Request and response are small and written in one or two send() calls,
+// so Nagle's algorithm only adds a delayed-ACK stall to every round trip.
+inline void disable_nagle( Socket::Handler sock )
+{
+  int enable = 1;
+  ::setsockopt( sock, IPPROTO_TCP, TCP_NODELAY, reinterpret_cast<const char*>(&enable), sizeof(enable) );
+}
+
+} // anonymous namespace
+
 Socket::Socket()
 {
   if( (sock = socket( PF_INET, SOCK_STREAM, IPPROTO_TCP )) == -1 )
@@ -24,6 +36,8 @@ Socket::Socket()
   }
 #endif //WIN32
 
+  disable_nagle( sock );
+
 #if defined(__APPLE__)
   {
   int enable = 1;
@@ -124,6 +138,8 @@ Socket Socket::accept()
   if( new_sock == -1 )
     throw network_error( "Socket::accept" );
 
+  disable_nagle( new_sock );
+
   return Socket( new_sock, Inet_addr(addr) );
 }
 
@@ -23,7 +23,7 @@ private:
   Inet_addr peer;
 
 public:
-  //! Creates TCP, reusable socket.
+  //! Creates TCP, reusable socket with Nagle algorithm disabled.
   Socket();
   //! Create object from existing socket handler.
   Socket( Handler, const Inet_addr& );